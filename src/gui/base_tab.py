@@ -1,17 +1,41 @@
 import logging
+import os
+import threading
+from concurrent.futures import Executor, Future
+from typing import Dict, List, Optional
 from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit, QPushButton,
-    QTextEdit, QProgressBar, QFileDialog, QWidget, QMessageBox, QCheckBox, QScrollArea
+    QPlainTextEdit, QListView, QProgressBar, QFileDialog, QWidget, QMessageBox, QCheckBox, QScrollArea
 )
-from PyQt5.QtCore import Qt, QThreadPool
-from utils.worker import Worker
+from PyQt5.QtCore import Qt, QThreadPool, QTimer, QSettings, QStringListModel, pyqtSignal
+from utils.utilities import iter_las_files
+from utils.worker import ErrorPayload, Worker, WorkerSignals, accepts_keyword, format_worker_error
+
+# Upper bound on the number of lines kept in the output console. Older lines are
+# discarded once the limit is reached so long runs don't grow memory unbounded.
+LOG_MAX_BLOCK_COUNT = 1000
+
+# Interval at which buffered log messages are flushed to the output console.
+LOG_FLUSH_INTERVAL_MS = 75
+
+# File dialog options that skip custom icon lookups and symlink resolution, which
+# make dialogs slow on network mounts and directories with many LAS/LAZ files.
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks | QFileDialog.ReadOnly
+
+# QSettings key holding the last directory visited in a file dialog.
+LAST_DIRECTORY_KEY = 'paths/last_directory'
 
 
 class BaseTab(QWidget):
     """
     Base tab for running processes with advanced options and progress tracking.
     """
-    def __init__(self, title: str, run_process: callable, emitter: logging.Logger):
+    # Emitted with a finished batch future; crosses from the executor's thread to the GUI thread.
+    batch_file_done = pyqtSignal(object)
+
+    def __init__(self, title: str, run_process: callable, emitter: logging.Logger,
+                 batch_process: callable = None, executor: Optional[Executor] = None,
+                 high_volume_log: bool = False):
         """
         Initialize the base tab.
 
@@ -19,28 +43,99 @@ class BaseTab(QWidget):
             title (str): The title of the tab.
             run_process (callable): The function to run when the process is started.
             emitter (logging.Logger): The log emitter for logging messages.
+            batch_process (callable, optional): Picklable module-level function run once per
+                LAS/LAZ file when a directory is selected. Defaults to None.
+            executor (Executor, optional): Executor used to run batch_process. Batch mode is
+                disabled unless both batch_process and executor are given. Defaults to None.
+            high_volume_log (bool, optional): Show output in a list view backed by a string
+                list model, which only lays out visible lines. Meant for very long runs.
+                Defaults to False.
         """
         super().__init__()
         self.title = title
         self.run_process = run_process
         self.emitter = emitter
+        self.batch_process = batch_process
+        self.executor = executor
+        self.high_volume_log = high_volume_log
+        self._batch_paths: Dict[Future, str] = {}
+        self.batch_file_done.connect(self.on_batch_file_done)
+        self._task_id: Optional[int] = None
+        self._cancel_token: Optional[threading.Event] = None
+        self.init_worker_signals()
         self.init_logging()
         self.initUI()
 
+    def init_worker_signals(self):
+        """
+        Create the signals shared by all workers started from this tab and connect them once.
+        """
+        self.worker_signals = WorkerSignals(self)
+        self.worker_signals.result.connect(self.on_process_complete)
+        self.worker_signals.error.connect(self.on_process_error)
+        self.worker_signals.progress.connect(self.on_process_progress)
+
     def init_logging(self):
         """
         Initialize logging by connecting the emitter's log signal to the log message handler.
+
+        Messages are buffered and written to the output console in batches by a timer,
+        so a burst of log records costs a single widget update. The connection is
+        always queued, so the buffer is only touched from the GUI thread, even
+        when the emitter lives in the same thread.
         """
-        self.emitter.log_message.connect(self.append_log_message)
+        self._log_buf: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+        self.emitter.log_message.connect(self.append_log_message, Qt.QueuedConnection)
 
     def append_log_message(self, message: str):
         """
-        Append log messages to the output text area.
+        Queue a log message for the output text area.
 
         Args:
             message (str): The log message to append.
         """
-        self.output_text.append(message)
+        self._log_buf.append(message)
+
+    def _flush_log(self):
+        """
+        Write all buffered log messages to the output text area in one append.
+        """
+        if self._log_buf:
+            self.append_output('\n'.join(self._log_buf))
+            self._log_buf.clear()
+
+    def append_output(self, text: str):
+        """
+        Append text to the output console.
+
+        Args:
+            text (str): The text to append. In high volume mode each line becomes a row.
+        """
+        if self._log_model is None:
+            self.output_text.appendPlainText(text)
+            return
+
+        lines = text.splitlines()
+        if not lines:
+            return
+        row = self._log_model.rowCount()
+        self._log_model.insertRows(row, len(lines))
+        for offset, line in enumerate(lines):
+            self._log_model.setData(self._log_model.index(row + offset), line)
+        self.output_text.scrollToBottom()
+
+    def clear_output(self):
+        """
+        Clear the output console.
+        """
+        if self._log_model is None:
+            self.output_text.clear()
+        else:
+            self._log_model.setStringList([])
 
     def initUI(self):
         """
@@ -60,8 +155,17 @@ class BaseTab(QWidget):
         self.layout.addWidget(self.start_btn)
 
         # Output Text Box and Progress Bar
-        self.output_text = QTextEdit(self)
-        self.output_text.setReadOnly(True)
+        if self.high_volume_log:
+            self._log_model = QStringListModel(self)
+            self.output_text = QListView(self)
+            self.output_text.setModel(self._log_model)
+            self.output_text.setUniformItemSizes(True)
+            self.output_text.setEditTriggers(QListView.NoEditTriggers)
+        else:
+            self._log_model = None
+            self.output_text = QPlainTextEdit(self)
+            self.output_text.setReadOnly(True)
+            self.output_text.setMaximumBlockCount(LOG_MAX_BLOCK_COUNT)
         self.layout.addWidget(self.output_text)
 
         # Progress Bar
@@ -139,42 +243,149 @@ class BaseTab(QWidget):
 
     def execute_process(self, input_path: str, **params):
         """
-        Execute the process using a worker thread.
+        Execute the process using a worker thread, or in batch mode when the
+        input path is a directory and the tab supports it.
+
+        If the process has a ``progress_callback`` parameter, it receives a function
+        that updates the progress bar.
 
         Args:
             input_path (str): The input directory path.
             params (dict): Additional parameters for the process.
         """
         self.progress_bar.setValue(0)
-        self.output_text.clear()
+        self._log_buf.clear()
+        self.clear_output()
 
-        worker = Worker(self.run_process, input_path, **params)
-        worker.signals.result.connect(self.on_process_complete)
-        worker.signals.error.connect(self.on_process_error)
-        worker.signals.progress.connect(self.update_progress)
+        # A new run supersedes the previous one, whose result would be ignored anyway.
+        self.cancel_process()
+        self.cancel_batch()
+
+        if self.batch_process is not None and self.executor is not None and os.path.isdir(input_path):
+            self.execute_batch(input_path, **params)
+            return
+
+        worker = Worker(self.worker_signals, self.run_process, input_path, **params)
+        if accepts_keyword(self.run_process, 'progress_callback'):
+            worker.kwargs['progress_callback'] = worker.throttled_progress.emit
+        self._task_id = worker.task_id
+        self._cancel_token = worker.cancel_token
         QThreadPool.globalInstance().start(worker)
 
-    def on_process_complete(self, result: str):
+    def cancel_process(self):
+        """
+        Ask the running worker process, if any, to stop, and ignore anything it still emits.
+        """
+        if self._cancel_token is not None:
+            self._cancel_token.set()
+            self._cancel_token = None
+        self._task_id = None
+
+    def cancel_batch(self):
+        """
+        Cancel the files of the current batch run that have not started yet.
+
+        Files already running in the executor finish, but their results are ignored.
+        """
+        # Swapped out first: cancelling runs the done callbacks, which look up this dict.
+        pending, self._batch_paths = self._batch_paths, {}
+        for future in pending:
+            future.cancel()
+
+    def execute_batch(self, input_path: str, **params):
+        """
+        Run the batch process on every LAS/LAZ file in a directory using the executor.
+
+        Args:
+            input_path (str): The input directory path.
+            params (dict): Additional parameters for the process.
+        """
+        files = sorted(iter_las_files(input_path))
+        if not files:
+            QMessageBox.warning(self, "Error", "No LAS/LAZ files found in the selected directory.")
+            return
+
+        self._batch_paths = {}
+        self._batch_total = len(files)
+        self._batch_done = 0
+        self._batch_failed = 0
+        for path in files:
+            future = self.executor.submit(self.batch_process, path, **params)
+            self._batch_paths[future] = path
+            future.add_done_callback(self.batch_file_done.emit)
+
+    def on_batch_file_done(self, future: Future):
+        """
+        Handle a finished file from a batch run.
+
+        Args:
+            future (Future): The finished future for one file.
+        """
+        path = self._batch_paths.pop(future, None)
+        if path is None:
+            # Left over from a batch that has since been restarted.
+            return
+
+        self._batch_done += 1
+        try:
+            result = future.result()
+        except Exception as e:
+            self._batch_failed += 1
+            logging.error("%s failed for %s: %s", self.title, path, e)
+        else:
+            self._flush_log()
+            self.append_output(f"== {path} ==\n{result}")
+        self.update_progress(self._batch_done * 100 // self._batch_total)
+
+        if self._batch_done == self._batch_total:
+            if self._batch_failed:
+                QMessageBox.critical(
+                    self, "Error",
+                    f"{self.title} failed for {self._batch_failed} of {self._batch_total} files."
+                )
+            else:
+                QMessageBox.information(self, "Success", f"{self.title} completed successfully.")
+
+    def on_process_complete(self, task_id: int, result: str):
         """
         Handle the process completion signal.
 
         Args:
+            task_id (int): The id of the task that completed.
             result (str): The result message from the process.
         """
-        self.output_text.append(result)
+        if task_id != self._task_id:
+            return
+        self._flush_log()
+        self.append_output(result)
         self.progress_bar.setValue(100)
         QMessageBox.information(self, "Success", f"{self.title} completed successfully.")
 
-    def on_process_error(self, error: tuple):
+    def on_process_error(self, task_id: int, error: ErrorPayload):
         """
         Handle the process error signal.
 
         Args:
-            error (tuple): The error information.
+            task_id (int): The id of the task that failed.
+            error (ErrorPayload): The error information (exc_type, exc_value, frames).
         """
-        self.output_text.append(f"Error: {error}")
+        if task_id != self._task_id:
+            return
+        self._flush_log()
+        self.append_output(f"Error: {format_worker_error(error)}")
         self.progress_bar.setValue(0)
-        QMessageBox.critical(self, "Error", f"An error occurred during {self.title}: {error}")
+        QMessageBox.critical(self, "Error", f"An error occurred during {self.title}: {error.exc_value}")
+
+    def on_process_progress(self, task_id: int, value: int):
+        """
+        Handle the process progress signal.
+
+        Args:
+            task_id (int): The id of the task reporting progress.
+            value (int): The progress value to set.
+        """
+        if task_id == self._task_id:
+            self.update_progress(value)
 
     def update_progress(self, value: int):
         """
@@ -189,6 +400,28 @@ class BaseTab(QWidget):
         """
         Open a directory dialog for the user to select an input directory.
         """
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
+        start = self.dir_input.text() or self.last_directory()
+        directory = QFileDialog.getExistingDirectory(
+            self, "Select Directory", start, QFileDialog.ShowDirsOnly | FILE_DIALOG_OPTIONS
+        )
         if directory:
             self.dir_input.setText(directory)
+            self.remember_directory(directory)
+
+    def last_directory(self) -> str:
+        """
+        Get the last directory visited in a file dialog.
+
+        Returns:
+            str: The last visited directory, or an empty string if none was saved.
+        """
+        return QSettings().value(LAST_DIRECTORY_KEY, '', type=str)
+
+    def remember_directory(self, directory: str):
+        """
+        Save the directory visited in a file dialog so the next dialog opens there.
+
+        Args:
+            directory (str): The directory to save.
+        """
+        QSettings().setValue(LAST_DIRECTORY_KEY, directory)
@@ -1,8 +1,10 @@
 import sys
 from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget
-from gui.lasindex_tab import LasIndexTab
-from gui.lasinfo_tab import LasInfoTab
-from utils.utilities import load_config, setup_logging
+from gui.base_tab import BaseTab
+from gui.run_lasinfo_tab import LasInfoTab
+from utils.log_emitter import LogEmitter, LogEmitterHandler
+from utils.utilities import AppConfig, init_process_logging, load_config, setup_logging
+from utils.worker import get_process_pool, shutdown_process_pool
 
 class MainWindow(QMainWindow):
     """
@@ -12,21 +14,31 @@ class MainWindow(QMainWindow):
     """
     def __init__(self):
         super().__init__()
+        # Forwards log records to the tabs' output consoles.
+        self.log_emitter = LogEmitter(self)
         self.config = self.load_and_setup_config()
+        # Shared by the tabs to process the files of a directory in parallel. It is the
+        # same pool submit_task uses, so the two never oversubscribe the cores. Worker
+        # processes log through the listener's queue.
+        self._pool = get_process_pool(
+            initializer=init_process_logging,
+            initargs=(self.log_listener.queue, self.config.log_level)
+        )
         self.initUI()
 
-    def load_and_setup_config(self) -> dict:
+    def load_and_setup_config(self) -> AppConfig:
         """
         Load configuration and set up logging.
 
         Returns:
-            dict: Configuration dictionary loaded from the config file.
+            AppConfig: Configuration loaded from the config file.
         """
         config = load_config()
-        setup_logging(
-            config['Logging']['LogDirectory'],
-            config['Logging']['LogFile'],
-            config['Logging']['LogLevel']
+        self.log_listener = setup_logging(
+            config.log_dir,
+            config.log_file,
+            config.log_level,
+            extra_handlers=[LogEmitterHandler(self.log_emitter)]
         )
         return config
 
@@ -41,29 +53,48 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget(self)
         self.setCentralWidget(self.tab_widget)
 
-        default_directory = self.config['Paths']['DefaultDirectory']
-
-        self.add_tabs(default_directory)
+        self.add_tabs(self.config.default_directory, self.config.high_volume_log)
 
-    def add_tabs(self, default_directory: str):
+    def add_tabs(self, default_directory: str, high_volume_log: bool = False):
         """
         Add tabs for different processing tasks.
 
         Args:
             default_directory (str): The default directory path for processing.
+            high_volume_log (bool, optional): Whether tabs use the high volume log view.
+                Defaults to False.
         """
-        lasindex_tab = LasIndexTab(default_directory)
-        lasinfo_tab = LasInfoTab(default_directory)
+        lasinfo_tab = LasInfoTab(
+            default_directory, self.log_emitter, executor=self._pool, high_volume_log=high_volume_log
+        )
 
-        self.tab_widget.addTab(lasindex_tab, "Index")
         self.tab_widget.addTab(lasinfo_tab, "Info")
 
+    def closeEvent(self, event):
+        """
+        Cancel running tasks, shut down the process pool and flush pending log records
+        when the window is closed.
+
+        Args:
+            event (QCloseEvent): The close event.
+        """
+        for index in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(index)
+            if isinstance(tab, BaseTab):
+                tab.cancel_process()
+                tab.cancel_batch()
+        shutdown_process_pool()
+        self.log_listener.stop()
+        super().closeEvent(event)
+
 def main():
     """
     Main entry point of the application. Sets up the application and
     displays the main window.
     """
     app = QApplication(sys.argv)
+    app.setOrganizationName('LiDAR Processing Wizard')
+    app.setApplicationName('LiDAR Processing Wizard')
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
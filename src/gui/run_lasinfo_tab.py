@@ -1,41 +1,120 @@
 import logging
-from PyQt5.QtWidgets import QCheckBox, QSpinBox, QLineEdit, QVBoxLayout, QFileDialog
-from gui.base_tab import BaseTab
+import os
+import threading
+from concurrent.futures import CancelledError, Executor
+from typing import Any, Callable, List, Optional
+from PyQt5.QtWidgets import QCheckBox, QSpinBox, QLineEdit, QFormLayout, QFileDialog, QWidget
+from gui.base_tab import BaseTab, FILE_DIALOG_OPTIONS
 from utils.form_builder import FormBuilder
 from processing.run_lasinfo import run_lasinfo
 from processing.params_config import get_param_group, load_params
 
+# Line edit parameters whose text is passed to lasinfo as separate values
+SPLIT_SET = frozenset({'set_bb', 'set_bounding_box', 'set_creation_date', 'set_number_of_points_by_return'})
+
+def _collect_checkbox(widget: QCheckBox) -> Optional[bool]:
+    """Collect a checkbox value, or None if it is unchecked."""
+    return widget.isChecked() or None
+
+def _spinbox_collector(initial: int) -> Callable[[QSpinBox], Optional[int]]:
+    """Collect a spinbox value, or None if it is still at its initial value."""
+    return lambda widget: value if (value := widget.value()) != initial else None
+
+def _collect_lineedit(widget: QLineEdit) -> Optional[str]:
+    """Collect a line edit value, or None if it is empty."""
+    return widget.text() or None
+
+def _collect_split_lineedit(widget: QLineEdit) -> Optional[List[str]]:
+    """Collect a line edit value split on whitespace, or None if it is empty."""
+    return widget.text().split() or None
+
+class WidgetSpec:
+    """
+    A parameter widget together with the function that collects its value.
+    """
+    __slots__ = ('param', 'widget', 'collect')
+
+    def __init__(self, param: str, widget: QWidget, collect: Callable[[QWidget], Any]):
+        """
+        Initialize the widget spec.
+
+        Args:
+            param (str): The parameter name.
+            widget (QWidget): The widget holding the parameter value.
+            collect (Callable[[QWidget], Any]): Returns the widget's value, or None to omit it.
+        """
+        self.param = param
+        self.widget = widget
+        self.collect = collect
+
 class LasInfoTab(BaseTab):
     """
     Tab for viewing LAS file information. Inherits from BaseTab.
     """
-    def __init__(self, default_directory: str, emitter: logging.Logger):
+    def __init__(self, default_directory: str, emitter: logging.Logger, executor: Optional[Executor] = None,
+                 high_volume_log: bool = False):
         """
         Initialize the LAS Info tab.
 
         Args:
             default_directory (str): The default directory path.
             emitter (logging.Logger): The log emitter for logging messages.
+            executor (Executor, optional): Executor used to run lasinfo on every file
+                of a selected directory. Defaults to None.
+            high_volume_log (bool, optional): Show output in a list view suited to very
+                long runs. Defaults to False.
         """
         self.default_directory = default_directory
         params = load_params()
         self.LASINFO_PARAMS = get_param_group(params, "LASINFO_PARAMS")
-        super().__init__('View LAS Info', self.run_process, emitter)
+        super().__init__(
+            'View LAS Info', self.run_process, emitter,
+            batch_process=run_lasinfo, executor=executor, high_volume_log=high_volume_log
+        )
 
     def initUI(self):
         """
         Initialize the user interface components for the LAS Info tab.
+
+        The parameter form is built the first time the advanced options are shown.
         """
         super().initUI()
         self.dir_input.setText(self.default_directory)
 
-        self.form_layout = QVBoxLayout()
-        form_builder = FormBuilder(self.form_layout)
         self.params_widgets = {}
+        self._specs: List[WidgetSpec] = []
+        self._form_built = False
 
-        self.init_parameters(form_builder)
+    def toggle_advanced_options(self, checked: bool):
+        """
+        Toggle the visibility of the advanced options section, building the
+        parameter form on first use.
 
-        self.advanced_options_layout.addLayout(self.form_layout)
+        Args:
+            checked (bool): Whether the advanced options are checked (visible).
+        """
+        if checked and not self._form_built:
+            self._build_form()
+        super().toggle_advanced_options(checked)
+
+    def _build_form(self):
+        """
+        Build the parameter form inside the advanced options section.
+
+        Updates are suspended while the rows are added so the form is laid out and
+        painted once rather than after every row.
+        """
+        self.advanced_options_content.setUpdatesEnabled(False)
+        try:
+            self.form_layout = QFormLayout()
+            form_builder = FormBuilder(self.form_layout)
+
+            self.init_parameters(form_builder)
+
+            self.advanced_options_layout.addRow(self.form_layout)
+        finally:
+            self.advanced_options_content.setUpdatesEnabled(True)
+        self._form_built = True
 
     def init_parameters(self, form_builder: FormBuilder):
         """
@@ -46,55 +125,71 @@ class LasInfoTab(BaseTab):
         """
         for param, config in self.LASINFO_PARAMS.items():
             if config['type'] == 'checkbox':
-                self.params_widgets[param] = form_builder.add_checkbox(config['label'], config.get('default', False))
+                widget = form_builder.add_checkbox(config['label'], config.get('default', False))
+                collector = _collect_checkbox
             elif config['type'] == 'spinbox':
-                self.params_widgets[param] = form_builder.add_spinbox(config['label'], config['min'], config['max'], config.get('default'))
-            elif config['type'] == 'lineedit']:
-                self.params_widgets[param] = form_builder.add_lineedit(config['label'], config.get('default', ''))
+                widget = form_builder.add_spinbox(config['label'], config['min'], config['max'], config.get('default'))
+                # The schema default, or the minimum when there is none, leaves lasinfo's own default.
+                collector = _spinbox_collector(widget.value())
+            elif config['type'] == 'lineedit':
+                widget = form_builder.add_lineedit(config['label'], config.get('default', ''))
+                collector = _collect_split_lineedit if param in SPLIT_SET else _collect_lineedit
+            else:
+                continue
+            self.params_widgets[param] = widget
+            self._specs.append(WidgetSpec(param, widget, collector))
 
     def collect_params(self) -> dict:
         """
         Collect parameters from the user inputs.
 
         Returns:
-            dict: The collected parameters.
-        """
-        params = {}
-        for param, widget in self.params_widgets.items():
-            if isinstance(widget, QCheckBox):
-                params[param] = widget.isChecked()
-            elif isinstance(widget, QSpinBox):
-                if widget.value() != widget.minimum() or widget.minimum() != 1:
-                    params[param] = widget.value()
-            elif isinstance(widget, QLineEdit):
-                text = widget.text()
-                if text:
-                    params[param] = text
-        return params
-
-    def run_process(self, input_path: str, **params):
+            dict: The collected parameters. Empty if the advanced options were never opened.
+        """
+        return {
+            spec.param: value
+            for spec in self._specs
+            if (value := spec.collect(spec.widget)) is not None
+        }
+
+    def run_process(self, input_path: str, progress_callback: callable = None,
+                    cancel_token: threading.Event = None, **params):
         """
         Run the LAS info process.
 
         Args:
             input_path (str): The input directory path.
+            progress_callback (callable, optional): Called with progress percentages.
+            cancel_token (threading.Event, optional): Set to stop lasinfo early.
             params (dict): Additional parameters for the process.
         """
         try:
             logging.info("Starting LAS info process...")
-            result = run_lasinfo(input_path, **params)
+            result = run_lasinfo(input_path, progress_callback=progress_callback, cancel_token=cancel_token, **params)
             logging.info("LAS info process completed.")
-            self.output_text.append(result)  # Append the result to the console
-            return result
+            return result  # Shown in the console by on_process_complete
+        except CancelledError:
+            logging.info("LAS info process cancelled.")
+            raise
         except Exception as e:
             logging.error(f"An error occurred during LAS info processing: {str(e)}")
-            self.output_text.append(f"An error occurred: {str(e)}")  # Append error to the console
-            raise
+            raise  # Shown in the console by on_process_error
 
     def browse_directory(self):
         """
         Open a file dialog for the user to select an LAS file.
+
+        The dialog starts in the folder of the path already entered, if it exists,
+        so Qt does not scan an unrelated directory first.
         """
-        file_path = QFileDialog.getOpenFileName(self, "Select LAS File", "", "LAS Files (*.las *.laz)")[0]
+        current = self.dir_input.text()
+        if current and os.path.exists(current):
+            start = current if os.path.isdir(current) else os.path.dirname(current)
+        else:
+            start = self.last_directory() or self.default_directory
+        file_path = QFileDialog.getOpenFileName(
+            self, "Select LAS File", start, "LAS Files (*.las *.laz)", options=FILE_DIALOG_OPTIONS
+        )[0]
         if file_path:
             self.dir_input.setText(file_path)
+            self.remember_directory(os.path.dirname(file_path))
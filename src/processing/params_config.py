@@ -1,14 +1,30 @@
+import functools
 import json
-import os
 import logging
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Callable, List, Sequence, Tuple
+
+# The parameter schema shipped in the repository's config directory. It is resolved
+# from this file so the schema is found whatever the working directory is.
+DEFAULT_PARAMS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'config', 'lastools_params.json'
+)
 
-def load_params(config_path: str = 'config/las_params.json') -> Dict[str, Dict[str, Any]]:
+# Parameter groups already looked up, keyed by (id(params), group_name). The params
+# dict is stored alongside the group so a recycled id is never mistaken for a hit.
+_param_group_cache: Dict[Tuple[int, str], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+@functools.lru_cache(maxsize=None)
+def load_params(config_path: str = DEFAULT_PARAMS_PATH) -> Dict[str, Dict[str, Any]]:
     """
     Load parameters from a JSON configuration file.
 
+    The result is cached per path, so the file is only read once. The returned
+    dictionary is shared and must not be modified.
+
     Args:
-        config_path (str, optional): Path to the JSON configuration file. Defaults to 'config/las_params.json'.
+        config_path (str, optional): Path to the JSON configuration file. Defaults to DEFAULT_PARAMS_PATH.
 
     Returns:
         Dict[str, Dict[str, Any]]: The loaded parameters.
@@ -17,14 +33,13 @@ def load_params(config_path: str = 'config/las_params.json') -> Dict[str, Dict[s
         FileNotFoundError: If the configuration file does not exist.
         json.JSONDecodeError: If the configuration file is not a valid JSON.
     """
-    if not os.path.exists(config_path):
-        logging.error(f"Configuration file not found: {config_path}")
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
     try:
         with open(config_path, 'r') as file:
             params = json.load(file)
         logging.info(f"Parameters successfully loaded from {config_path}")
+    except FileNotFoundError:
+        logging.error(f"Configuration file not found: {config_path}")
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     except json.JSONDecodeError as e:
         logging.error(f"Error decoding JSON from configuration file: {config_path} - {e}")
         raise
@@ -45,19 +60,113 @@ def get_param_group(params: Dict[str, Dict[str, Any]], group_name: str) -> Dict[
     Raises:
         KeyError: If the parameter group is not found.
     """
+    key = (id(params), group_name)
+    cached = _param_group_cache.get(key)
+    if cached is not None and cached[0] is params:
+        return cached[1]
+
     try:
         param_group = params[group_name]
         logging.info(f"Parameter group '{group_name}' successfully retrieved.")
-        return param_group
     except KeyError:
         logging.error(f"Parameter group '{group_name}' not found in the parameters.")
         raise
 
-# Load the parameters from the configuration file
-params = load_params()
+    _param_group_cache[key] = (params, param_group)
+    return param_group
+
+def _checkbox_tokens(flag: str) -> Callable[[Any], Sequence[str]]:
+    """Emit the flag only when the checkbox is set."""
+    return lambda value: (flag,) if value else ()
+
+def _spinbox_tokens(flag: str) -> Callable[[Any], Sequence[str]]:
+    """Emit the flag followed by the numeric value."""
+    return lambda value: (flag, str(value))
+
+def _lineedit_tokens(flag: str) -> Callable[[Any], Sequence[str]]:
+    """Emit the flag followed by the text, or by each item of a split value."""
+    return lambda value: (flag, *map(str, value)) if isinstance(value, list) else (flag, str(value))
+
+def _generic_tokens(flag: str, value: Any) -> Sequence[str]:
+    """Emit tokens for a parameter that is not part of the schema."""
+    if isinstance(value, bool):
+        return (flag,) if value else ()
+    if isinstance(value, list):
+        return (flag, *map(str, value))
+    return (flag, str(value))
+
+# Command-line token builders for each widget type in the parameter schema
+_TOKEN_BUILDERS = {
+    'checkbox': _checkbox_tokens,
+    'spinbox': _spinbox_tokens,
+    'lineedit': _lineedit_tokens,
+}
+
+def compile_command_builder(executable: str, param_group: Dict[str, Any]) -> Callable[..., List[str]]:
+    """
+    Create a command builder specialized for a parameter group.
+
+    Each parameter in the group gets its token builder once, based on its widget
+    type. Building a command then needs one lookup per parameter and no type
+    checks. Parameters missing from the group fall back to a type-based conversion.
+
+    Args:
+        executable (str): The LAStools executable to run.
+        param_group (Dict[str, Any]): The parameter group describing the command's flags.
+
+    Returns:
+        Callable[..., List[str]]: A function taking the input path and parameter values
+        that returns the command as a list of arguments.
+    """
+    builders = {
+        param: _TOKEN_BUILDERS[config['type']](f'-{param}')
+        for param, config in param_group.items()
+        if config['type'] in _TOKEN_BUILDERS
+    }
+
+    def build_command(input_path: str, **params: Any) -> List[str]:
+        command = [executable, '-i', input_path]
+        for param, value in params.items():
+            builder = builders.get(param)
+            command.extend(builder(value) if builder else _generic_tokens(f'-{param}', value))
+        return command
+
+    return build_command
+
+@functools.lru_cache(maxsize=None)
+def get_command_builder(executable: str, group_name: str) -> Callable[..., List[str]]:
+    """
+    Get the cached command builder for an executable and its parameter group.
+
+    Args:
+        executable (str): The LAStools executable to run.
+        group_name (str): The name of the parameter group describing the command's flags.
+
+    Returns:
+        Callable[..., List[str]]: The command builder.
+    """
+    return compile_command_builder(executable, get_param_group(load_params(), group_name))
+
+# Parameter groups exposed as module attributes, loaded on first access
+PARAM_GROUPS = (
+    "LASINFO_PARAMS",
+    # Add more parameter groups as needed
+    # "LASCLASSIFY_PARAMS",
+)
+
+def __getattr__(name: str) -> Dict[str, Any]:
+    """
+    Load parameter groups such as LASINFO_PARAMS lazily on first attribute access.
+
+    Args:
+        name (str): The attribute name.
 
-# Access specific parameter groups
-LASINFO_PARAMS = get_param_group(params, "LASINFO_PARAMS")
+    Returns:
+        Dict[str, Any]: The parameter group.
 
-# Add more parameter groups as needed
-# LASCLASSIFY_PARAMS = get_param_group(params, "LASCLASSIFY_PARAMS")
+    Raises:
+        AttributeError: If the name is not a known parameter group.
+    """
+    if name in PARAM_GROUPS:
+        return get_param_group(load_params(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,52 @@
+import io
+import re
 import subprocess
 import logging
-from typing import Any, Dict
+import threading
+from concurrent.futures import CancelledError
+from typing import Any, Callable, Dict, Optional
+from .params_config import get_command_builder
 
+logger = logging.getLogger(__name__)
 
-def run_lasinfo(input_path: str, **params: Any) -> str:
+# Matches progress lines such as "processing ... 42%" reported by LAStools.
+PROGRESS_PATTERN = re.compile(r'^processing\b.*?(\d{1,3})%')
+
+# Interval in seconds at which a running command checks whether it was cancelled.
+CANCEL_POLL_INTERVAL = 0.1
+
+
+def _terminate_on_cancel(proc: subprocess.Popen, cancel_token: threading.Event):
+    """
+    Terminate a process once the cancel token is set. Returns when the process exits.
+
+    Runs on its own thread, so a command that writes nothing for a long time can
+    still be cancelled.
+
+    Args:
+        proc (subprocess.Popen): The running process.
+        cancel_token (threading.Event): The token to watch.
+    """
+    while proc.poll() is None:
+        if cancel_token.wait(CANCEL_POLL_INTERVAL):
+            proc.terminate()
+            return
+
+
+def run_lasinfo(input_path: str, progress_callback: Optional[Callable[[int], None]] = None,
+                cancel_token: Optional[threading.Event] = None, **params: Any) -> str:
     """
     Run the lasinfo command with specified parameters on the input file.
 
+    The report written to stderr is read line by line while the command runs, so
+    progress can be reported before the command finishes.
+
     Args:
         input_path (str): Path to the input LAS file.
+        progress_callback (callable, optional): Called with a percentage whenever
+            lasinfo reports progress. Defaults to None.
+        cancel_token (threading.Event, optional): When set, lasinfo is terminated, whether
+            or not it is writing output. Defaults to None.
         params (dict): Additional parameters for the lasinfo command.
 
     Returns:
@@ -16,36 +54,47 @@ def run_lasinfo(input_path: str, **params: Any) -> str:
 
     Raises:
         subprocess.CalledProcessError: If the lasinfo command fails.
+        concurrent.futures.CancelledError: If the run was cancelled through cancel_token.
     """
-    command = ['lasinfo', '-i', input_path]
-
-    for param, value in params.items():
-        if isinstance(value, bool) and value:
-            command.append(f'-{param}')
-        elif isinstance(value, list):
-            command.append(f'-{param}')
-            command.extend(map(str, value))
-        else:
-            command.append(f'-{param}')
-            command.append(str(value))
+    command = get_command_builder('lasinfo', 'LASINFO_PARAMS')(input_path, **params)
 
-    logging.info(f"Running command: {' '.join(command)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Running command: %s", ' '.join(command))
 
-    try:
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
-        logging.info("Command executed successfully")
-        return result.stderr  # Capturing stderr instead of stdout
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Command failed with error: {e.stderr}")
-        raise
+    lines = []
+    # lasinfo writes its report to stderr; stdout is not used. The pipe is opened in
+    # binary mode and decoded as UTF-8, replacing any undecodable bytes.
+    with subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as proc:
+        if cancel_token is not None:
+            threading.Thread(target=_terminate_on_cancel, args=(proc, cancel_token), daemon=True).start()
+        for line in io.TextIOWrapper(proc.stderr, encoding='utf-8', errors='replace'):
+            lines.append(line)
+            if progress_callback is not None:
+                match = PROGRESS_PATTERN.match(line)
+                if match:
+                    progress_callback(min(int(match.group(1)), 100))
+        returncode = proc.wait()
+
+    if cancel_token is not None and cancel_token.is_set():
+        logger.info("Command cancelled")
+        raise CancelledError()
+
+    output = ''.join(lines)
+    if returncode != 0:
+        logger.error("Command failed with error: %s", output)
+        raise subprocess.CalledProcessError(returncode, command, stderr=output)
+
+    logger.info("Command executed successfully")
+    return output
 
 
+# Run as a module from the src directory: python -m processing.run_lasinfo <input_path> ...
 if __name__ == "__main__":
     import sys
     logging.basicConfig(level=logging.INFO)
 
     if len(sys.argv) < 2:
-        print("Usage: python run_lasinfo.py <input_path> [param1=value1 param2=value2 ...]")
+        print("Usage: python -m processing.run_lasinfo <input_path> [param1=value1 param2=value2 ...]")
         sys.exit(1)
 
     input_path = sys.argv[1]
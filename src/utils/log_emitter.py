@@ -0,0 +1,40 @@
+import logging
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class LogEmitter(QObject):
+    """
+    Carries formatted log records to the tabs' output consoles.
+
+    Tabs connect to log_message with a queued connection, so it may be emitted
+    from any thread, such as the log listener's.
+    """
+    log_message = pyqtSignal(str)
+
+
+class LogEmitterHandler(logging.Handler):
+    """
+    Logging handler that emits each formatted record through a LogEmitter.
+    """
+    def __init__(self, emitter: LogEmitter, level: int = logging.NOTSET):
+        """
+        Initialize the handler.
+
+        Args:
+            emitter (LogEmitter): The emitter to send records through.
+            level (int, optional): The handler's level. Defaults to logging.NOTSET.
+        """
+        super().__init__(level)
+        self.emitter = emitter
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Emit a formatted record through the emitter's log_message signal.
+
+        Args:
+            record (logging.LogRecord): The record to emit.
+        """
+        try:
+            self.emitter.log_message.emit(self.format(record))
+        except Exception:
+            self.handleError(record)
@@ -1,42 +1,87 @@
 import logging
+import logging.handlers
 import configparser
+import multiprocessing
 import os
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional, Sequence
 import sys
 from datetime import datetime
 
-def load_config(config_path: str = 'config/config.ini') -> configparser.ConfigParser:
+# File extensions of LAS point cloud files
+LAS_EXTENSIONS = ('.las', '.laz')
+
+# Sections and keys that must be present in the configuration file
+REQUIRED_CONFIG_KEYS = {
+    'Paths': ['DefaultDirectory'],
+    'Logging': ['LogDirectory', 'LogFile', 'LogLevel'],
+}
+
+
+class AppConfig(NamedTuple):
+    """
+    Application settings read once from the configuration file.
+    """
+    log_dir: str
+    log_file: str
+    log_level: str
+    default_directory: str
+    high_volume_log: bool
+
+
+def load_config(config_path: str = 'config/config.ini') -> AppConfig:
     """
     Load configuration from the specified path.
 
+    Values are read and interpolated once, so later accesses are plain attribute
+    lookups on the returned tuple.
+
     Args:
         config_path (str, optional): Path to the configuration file. Defaults to 'config/config.ini'.
 
     Returns:
-        configparser.ConfigParser: The loaded configuration.
+        AppConfig: The loaded configuration.
 
     Raises:
         FileNotFoundError: If the configuration file does not exist.
+        ValueError: If a required section or key is missing.
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
     config = configparser.ConfigParser()
-    config.read(config_path)
-    return config
+    try:
+        with open(config_path, 'r') as file:
+            config.read_file(file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    validate_config(config, REQUIRED_CONFIG_KEYS)
+    return AppConfig(
+        log_dir=config['Logging']['LogDirectory'],
+        log_file=config['Logging']['LogFile'],
+        log_level=config['Logging']['LogLevel'],
+        default_directory=config['Paths']['DefaultDirectory'],
+        high_volume_log=config['Logging'].getboolean('HighVolume', fallback=False),
+    )
 
 
-def setup_logging(log_directory: str, log_file: str, log_level: Optional[str] = 'INFO') -> logging.Logger:
+def setup_logging(log_directory: str, log_file: str, log_level: Optional[str] = 'INFO',
+                  extra_handlers: Sequence[logging.Handler] = ()) -> logging.handlers.QueueListener:
     """
     Set up logging configuration.
 
+    The root logger only puts records on a queue. A listener thread takes them off
+    the queue and writes them to the log file and stdout, so logging calls never
+    wait on disk or console I/O. The queue is a multiprocessing queue, so worker
+    processes set up with init_process_logging write to the same listener.
+
     Args:
         log_directory (str): Directory to store log files.
         log_file (str): Base name of the log file.
         log_level (str, optional): Logging level. Defaults to 'INFO'.
+        extra_handlers (Sequence[logging.Handler], optional): Further handlers run by the
+            listener, such as one forwarding records to the GUI. Defaults to ().
 
     Returns:
-        logging.Logger: Configured logger instance.
+        logging.handlers.QueueListener: The started listener. Call its stop() method
+        on shutdown to flush the remaining records. Its queue attribute is the log queue.
     """
     if not os.path.exists(log_directory):
         os.makedirs(log_directory)
@@ -46,17 +91,40 @@ def setup_logging(log_directory: str, log_file: str, log_level: Optional[str] =
     log_file_with_timestamp = f"{os.path.splitext(log_file)[0]}_{timestamp}{os.path.splitext(log_file)[1]}"
     log_path = os.path.join(log_directory, log_file_with_timestamp)
 
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper(), logging.INFO),
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_path),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_path),
+        logging.StreamHandler(sys.stdout),
+        *extra_handlers
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = multiprocessing.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    logger = logging.getLogger()
+    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
+    listener.start()
+    return listener
+
+
+def init_process_logging(log_queue: multiprocessing.Queue, log_level: Optional[str] = 'INFO') -> None:
+    """
+    Send the log records of a worker process to the parent's log listener.
+
+    Meant as the initializer of a process pool. Handlers inherited from the parent
+    when the process is forked are replaced, so records are not written twice.
+
+    Args:
+        log_queue (multiprocessing.Queue): The queue of the listener returned by setup_logging.
+        log_level (str, optional): Logging level. Defaults to 'INFO'.
+    """
     logger = logging.getLogger()
-    return logger
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
 
 
 def validate_config(config: configparser.ConfigParser, sections: dict) -> None:
@@ -74,5 +142,24 @@ def validate_config(config: configparser.ConfigParser, sections: dict) -> None:
         if section not in config:
             raise ValueError(f"Missing section in configuration file: {section}")
         for key in keys:
-            if key not in config[section]]:
+            if key not in config[section]:
                 raise ValueError(f"Missing key in section '{section}': {key}")
+
+
+def iter_las_files(directory: str) -> Iterator[str]:
+    """
+    Iterate over the LAS/LAZ files directly inside a directory.
+
+    Uses os.scandir, whose entries already know their file type, so no extra stat
+    call is made per entry on most platforms.
+
+    Args:
+        directory (str): The directory to scan.
+
+    Yields:
+        str: The path of each LAS/LAZ file.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(LAS_EXTENSIONS) and entry.is_file(follow_symlinks=False):
+                yield entry.path
@@ -1,21 +1,241 @@
+import collections
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
 import traceback
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor
 import logging
-from PyQt5.QtCore import QRunnable, pyqtSlot, pyqtSignal, QObject
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+from PyQt5.QtCore import Qt, QRunnable, QThreadPool, QTimer, pyqtSignal, QObject
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of traceback frames captured for a worker error
+ERROR_FRAME_LIMIT = 32
+
+# Payload of the error signal. frames is a list of (filename, lineno, name) triples.
+ErrorPayload = collections.namedtuple("ErrorPayload", "exc_type exc_value frames")
+
+# Source of the ids that tag every signal emitted on behalf of a task
+_task_ids = itertools.count(1)
+
+# Process pool shared by ProcessWorkers and the tabs, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Futures submitted by ProcessWorkers that have not finished yet
+_pending_futures: set = set()
 
 class WorkerSignals(QObject):
     """
-    Defines the signals available from a running worker thread.
+    Defines the signals available from running worker threads.
+
+    A single instance is shared by all the workers of one consumer. Every signal
+    carries the id of the task that emitted it as its first argument so slots can
+    tell tasks apart. Workers never create their own, so there is no per-task
+    QObject to allocate or pool.
 
     Supported signals are:
-    - result: object data returned from processing
-    - error: tuple (exctype, value, traceback)
-    - progress: int indicating % progress
-    - log: str log messages
+    - result: (task id, object data returned from processing)
+    - error: (task id, ErrorPayload (exc_type, exc_value, frames)), see format_worker_error
+    - progress: (task id, int indicating % progress)
+    - log: (task id, str log messages)
+
+    Slots that update widgets must use the default connection, which is queued across
+    threads. Thread-safe handlers such as logging functions can be attached with
+    connect_direct_log_handler, so they run in the emitting thread without an
+    event-loop round trip.
+    """
+    result = pyqtSignal(int, object)
+    error = pyqtSignal(int, object)  # object, so the ErrorPayload namedtuple arrives intact
+    progress = pyqtSignal(int, int)
+    log = pyqtSignal(int, str)
+
+
+class ResultBus(QObject):
+    """
+    Collects worker results in a deque and dispatches them on the GUI thread once per frame.
+
+    When many workers finish at nearly the same time, emitting each result as a
+    queued signal posts one event per result to the GUI thread's event queue.
+    Workers with a bus instead append to a deque, which is atomic under the GIL.
+    A single-shot timer, started by the first item posted to an empty bus, drains
+    the deque and calls the subscribed callbacks directly. An idle bus has no
+    running timer.
+
+    Create the bus on the GUI thread and assign it to ``worker.bus`` before
+    starting the worker.
+
+    :param parent: parent QObject.
+    :param interval_ms: interval between drains in milliseconds.
+    :param max_items: maximum number of items dispatched per drain.
+    """
+    # Starts the drain timer on the bus's thread; emitted by the post that finds the bus idle.
+    _wake = pyqtSignal()
+
+    def __init__(self, parent: QObject = None, interval_ms: int = 16, max_items: int = 256):
+        super().__init__(parent)
+        self.queue = collections.deque()
+        self.max_items = max_items
+        self._callbacks: Dict[str, List[Callable[[int, Any], None]]] = {}
+        self._scheduled = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.drain)
+        self._wake.connect(self._timer.start)
+
+    def subscribe(self, kind: str, callback: Callable[[int, Any], None]):
+        """
+        Register a callback for items of a kind, such as "result".
+
+        :param kind: the kind of item.
+        :param callback: called on the GUI thread with (task id, payload).
+        """
+        self._callbacks.setdefault(kind, []).append(callback)
+
+    def post(self, kind: str, task_id: int, payload: Any):
+        """
+        Queue an item for dispatch. Safe to call from any thread.
+
+        :param kind: the kind of item.
+        :param task_id: the id of the task that produced the item.
+        :param payload: the item's data.
+        """
+        self.queue.append((kind, task_id, payload))
+        if not self._scheduled:
+            self._scheduled = True
+            self._wake.emit()
+
+    def drain(self):
+        """
+        Dispatch up to max_items queued items to their callbacks, and schedule
+        another drain if items are left.
+        """
+        # Cleared before draining, so an item posted from now on wakes the bus again.
+        self._scheduled = False
+        for _ in range(min(len(self.queue), self.max_items)):
+            kind, task_id, payload = self.queue.popleft()
+            for callback in self._callbacks.get(kind, ()):
+                callback(task_id, payload)
+        if self.queue and not self._scheduled:
+            self._scheduled = True
+            self._timer.start()
+
+
+def _current_error() -> ErrorPayload:
+    """
+    Capture the exception being handled as an error signal payload.
+
+    Only the location of each frame is recorded, and only the innermost
+    ERROR_FRAME_LIMIT frames are kept, so the frame that raised is always included.
+    The exception itself is kept, so its __cause__ and __context__ stay available
+    to consumers. Its __traceback__ also keeps every frame alive, including the
+    arguments of the failed function, until the consumer drops the payload.
+
+    :return: the error payload.
+    """
+    exc_type, exc_value, exc_tb = sys.exc_info()
+    innermost = collections.deque(traceback.walk_tb(exc_tb), maxlen=ERROR_FRAME_LIMIT)
+    frames = [(frame.f_code.co_filename, lineno, frame.f_code.co_name) for frame, lineno in innermost]
+    return ErrorPayload(exc_type, exc_value, frames)
+
+
+def connect_direct_log_handler(signals: WorkerSignals, handler: Callable[[str], Any]) -> Callable[[int, str], None]:
+    """
+    Connect a thread-safe handler to the log signal with a direct connection.
+
+    The handler runs in the worker thread as soon as a message is emitted, instead
+    of having each message posted to the receiver's event loop. Only use this for
+    handlers that can be called from any thread, such as logging.getLogger().info,
+    and never for slots that touch widgets.
+
+    :param signals: the WorkerSignals to listen to.
+    :param handler: called with each log message.
+    :return: the connected slot, for use with signals.log.disconnect().
+    """
+    def slot(task_id: int, message: str):
+        handler(message)
+
+    signals.log.connect(slot, Qt.DirectConnection)
+    return slot
+
+
+def format_worker_error(error: ErrorPayload) -> str:
     """
-    result = pyqtSignal(object)
-    error = pyqtSignal(tuple)
-    progress = pyqtSignal(int)
-    log = pyqtSignal(str)
+    Format the error payload emitted by a worker into a traceback string.
+
+    Workers emit only the exception and its frame locations, so the cost of
+    formatting and source line lookup is only paid by consumers that display
+    the error.
+
+    :param error: the payload from the error signal.
+    :return: the formatted traceback.
+    """
+    frames = traceback.StackSummary.from_list(
+        [(filename, lineno, name, None) for filename, lineno, name in error.frames]
+    )
+    return ''.join(
+        ['Traceback (most recent call last):\n']
+        + frames.format()
+        + traceback.format_exception_only(error.exc_type, error.exc_value)
+    )
+
+
+def accepts_keyword(fn: callable, name: str) -> bool:
+    """
+    Check whether a function has a parameter with the given name.
+
+    Keywords injected by the caller, such as cancel_token, are only passed to functions
+    that declare them, so they never end up in a **params catch-all.
+
+    :param fn: the function to inspect.
+    :param name: the parameter name.
+    :return: True if the keyword can be passed to it.
+    """
+    try:
+        return name in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class ThrottledEmitter:
+    """
+    Forwards progress values to an emit function, dropping updates that arrive
+    too soon or change too little to be visible.
+
+    Each forwarded value is a queued cross-thread signal, so fine-grained progress
+    reporting is limited to about one update per frame. 100% is always forwarded.
+
+    :param emit: function called with each forwarded value.
+    :param step: minimum change in % progress between forwarded values.
+    :param interval: minimum time in seconds between forwarded values.
+    """
+    __slots__ = ('_emit', 'step', 'interval', '_last_value', '_last_time')
+
+    def __init__(self, emit: callable, step: int = 1, interval: float = 0.016):
+        self._emit = emit
+        self.step = step
+        self.interval = interval
+        self._last_value = None
+        self._last_time = 0.0
+
+    def emit(self, value: int):
+        """
+        Forward the value if enough time has passed and it changed enough.
+
+        :param value: % progress.
+        """
+        now = time.monotonic()
+        if value < 100 and self._last_value is not None and (
+            abs(value - self._last_value) < self.step or now - self._last_time < self.interval
+        ):
+            return
+        self._last_value = value
+        self._last_time = now
+        self._emit(value)
 
 
 class Worker(QRunnable):
@@ -23,32 +243,329 @@ class Worker(QRunnable):
     Worker thread
 
     Inherits from QRunnable to handle worker thread setup, signals, and wrap-up.
+    Start it on a pool from make_worker_pool() sized for the task's workload, or on
+    QThreadPool.globalInstance() for occasional one-off tasks.
 
+    :param signals: shared WorkerSignals instance to emit on, tagged with this worker's task_id.
     :param fn: function to run on this worker thread.
     :param args: Arguments to pass to the function.
+    :param cancel: event used to cancel the task. Defaults to a new threading.Event.
     :param kwargs: Keyword arguments to pass to the function.
+
+    Set ``bus`` to a ResultBus to deliver the result through it instead of the result signal.
+    The final progress update then follows the result on the bus as a "progress" item,
+    so it never arrives before the result.
+
+    Cancellation is cooperative. Setting ``cancel_token`` stops a task that has not
+    started yet. If fn has a ``cancel_token`` parameter it receives the event, and
+    it should check ``cancel_token.is_set()`` in its inner loops and raise
+    CancelledError when it is set. A cancelled task emits neither result nor error.
     """
-    def __init__(self, fn: callable, *args, **kwargs):
+    def __init__(self, signals: WorkerSignals, fn: callable, *args, cancel: Optional[threading.Event] = None, **kwargs):
         super().__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
-        self.signals = WorkerSignals()
+        self.cancel_token = cancel or threading.Event()
+        if accepts_keyword(fn, 'cancel_token'):
+            self.kwargs['cancel_token'] = self.cancel_token
+        self.signals = signals
+        self.bus = None
+        self.task_id = next(_task_ids)
+        # The pool deletes the runnable once run() returns. The shared signals are owned
+        # by the consumer on the GUI thread, so nothing is torn down across threads.
+        self.setAutoDelete(True)
+        self.throttled_progress = ThrottledEmitter(self.report_progress)
+        self._has_progress_receivers = signals.receivers(signals.progress) > 0
+        # PyQt creates a new bound signal on every attribute access, so cache the emitter.
+        self._emit_progress = signals.progress.emit
+        # Built once here so run() does no formatting. Arguments are left out; they may be large point arrays.
+        # Callables such as functools.partial have no __qualname__, so fall back to their repr.
+        fn_name = getattr(fn, '__qualname__', None) or repr(fn)
+        self._start_msg = f"Worker started: fn={fn_name}" if logger.isEnabledFor(logging.INFO) else None
+
+    def report_progress(self, value: int):
+        """
+        Emit a progress update for this task. Functions reporting frequent progress
+        should call throttled_progress.emit instead.
+
+        :param value: % progress.
+        """
+        self._emit_progress(self.task_id, value)
+
+    def report_log(self, message: str):
+        """
+        Emit a log message for this task.
+
+        :param message: the log message.
+        """
+        self.signals.log.emit(self.task_id, message)
 
-    @pyqtSlot()
     def run(self):
         """
         Initialize the runner function with passed args, kwargs.
+
+        Called directly by QThreadPool rather than through a signal, so it is not a slot.
         """
+        completed_ok = False
         try:
-            logging.info(f"Worker started with function {self.fn.__name__} and arguments {self.args}, {self.kwargs}")
-            self.signals.progress.emit(0)
+            if self._start_msg:
+                logger.info(self._start_msg)
+            if self.cancel_token.is_set():
+                raise CancelledError()
+            if self._has_progress_receivers:
+                self._emit_progress(self.task_id, 0)
             result = self.fn(*self.args, **self.kwargs)
-        except Exception as e:
-            traceback_str = traceback.format_exc()
-            logging.error(f"Error in worker thread: {traceback_str}")
-            self.signals.error.emit((e, traceback_str))
+        except CancelledError:
+            # The consumer asked for this, so it is neither reported nor logged as an error.
+            logger.info("Worker cancelled: task %d", self.task_id)
+        except Exception:
+            error = _current_error()
+            logger.error("Error in worker thread: %s: %s", error.exc_type.__name__, error.exc_value)
+            self.signals.error.emit(self.task_id, error)
         else:
-            self.signals.result.emit(result)
+            if self.bus is not None:
+                self.bus.post("result", self.task_id, result)
+            else:
+                self.signals.result.emit(self.task_id, result)
+            completed_ok = True
         finally:
-            self.signals.progress.emit(100)
+            # Errors are terminal, so the final update is only sent on success.
+            if completed_ok and self._has_progress_receivers:
+                if self.bus is not None:
+                    self.bus.post("progress", self.task_id, 100)
+                else:
+                    self._emit_progress(self.task_id, 100)
+            # Drop references so large arguments (point arrays) are freed even if this worker lingers.
+            self.fn = None
+            self.args = ()
+            self.kwargs = {}
+
+
+class MultiWorker(QRunnable):
+    """
+    Worker thread running many small tasks in a single QRunnable.
+
+    Submitting each tiny task (such as one per LiDAR tile) as its own Worker pays for
+    pool locking, signal emits and QRunnable teardown every time. MultiWorker pays
+    these once per batch. Progress is emitted once per chunk of tasks, and the
+    results are emitted together as a list in task order. The first failing task
+    stops the batch and emits the error. A task raising CancelledError stops the
+    batch without emitting anything.
+
+    :param signals: shared WorkerSignals instance to emit on, tagged with this worker's task_id.
+    :param tasks: sequence of (fn, args, kwargs) tuples to run in order.
+    :param chunk_size: number of tasks to run between progress updates.
+    """
+    def __init__(self, signals: WorkerSignals,
+                 tasks: Sequence[Tuple[Callable, tuple, Dict[str, Any]]], chunk_size: int = 100):
+        super().__init__()
+        self.tasks = tasks
+        self.chunk_size = max(1, chunk_size)
+        self.signals = signals
+        self.task_id = next(_task_ids)
+        self.setAutoDelete(True)
+        self._has_progress_receivers = signals.receivers(signals.progress) > 0
+
+    def run(self):
+        """
+        Run every task in order, reporting progress at chunk boundaries.
+        """
+        total = len(self.tasks)
+        results = []
+        completed_ok = False
+        emit_progress = self.signals.progress.emit
+        try:
+            logger.info("MultiWorker started: %d tasks", total)
+            for index, (fn, args, kwargs) in enumerate(self.tasks):
+                if index and index % self.chunk_size == 0:
+                    emit_progress(self.task_id, index * 100 // total)
+                results.append(fn(*args, **kwargs))
+        except CancelledError:
+            # The consumer asked for this, so it is neither reported nor logged as an error.
+            logger.info("MultiWorker cancelled: task %d", self.task_id)
+        except Exception:
+            error = _current_error()
+            logger.error("Error in worker thread: %s: %s", error.exc_type.__name__, error.exc_value)
+            self.signals.error.emit(self.task_id, error)
+        else:
+            self.signals.result.emit(self.task_id, results)
+            completed_ok = True
+        finally:
+            if completed_ok and self._has_progress_receivers:
+                emit_progress(self.task_id, 100)
+            self.tasks = ()
+
+
+def get_process_pool(initializer: Optional[Callable] = None, initargs: tuple = ()) -> ProcessPoolExecutor:
+    """
+    Get the process pool shared by the application, creating it on first use.
+
+    This is the only process pool, so processes never outnumber the cores.
+
+    :param initializer: called in each worker process when it starts, such as
+        utilities.init_process_logging. Only used when the pool is created.
+    :param initargs: arguments passed to initializer.
+    :return: a ProcessPoolExecutor with one process per core.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=initializer, initargs=initargs
+        )
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """
+    Cancel the ProcessWorker calls that have not started yet and shut down the shared pool
+    without waiting.
+
+    Futures submitted to the pool by other callers must be cancelled by their owners
+    first, otherwise the interpreter waits for them on exit.
+    """
+    global _process_pool
+    for future in list(_pending_futures):
+        future.cancel()
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False)
+        _process_pool = None
+
+
+class ProcessWorker:
+    """
+    Runs a function in a worker process and reports back through WorkerSignals.
+
+    A Worker's Python code shares the GIL with every other thread, so CPU-bound
+    pure-Python work gains nothing from more threads. ProcessWorker runs the
+    function in a separate process, where it can use a core of its own. The result or
+    error is emitted on the shared signals with this worker's task_id, and the
+    queued connection delivers it to the GUI thread.
+
+    fn must be a module-level function so it can be pickled, and its arguments and
+    result must be picklable too. Progress callbacks cannot cross the process
+    boundary.
+
+    :param signals: shared WorkerSignals instance to emit on, tagged with this worker's task_id.
+    :param fn: module-level function to run in a worker process.
+    :param args: Arguments to pass to the function.
+    :param kwargs: Keyword arguments to pass to the function.
+    """
+    __slots__ = ('fn', 'args', 'kwargs', 'signals', 'task_id')
+
+    def __init__(self, signals: WorkerSignals, fn: callable, *args, **kwargs):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.task_id = next(_task_ids)
+
+    def submit(self, executor: Optional[Executor] = None) -> Future:
+        """
+        Submit the function to a process pool.
+
+        :param executor: executor to run on. Defaults to the shared pool from get_process_pool().
+        :return: the future for the submitted call.
+        """
+        future = (executor or get_process_pool()).submit(self.fn, *self.args, **self.kwargs)
+        _pending_futures.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future):
+        """
+        Emit the result or error of a finished future. Runs on the executor's thread.
+
+        :param future: the finished future.
+        """
+        _pending_futures.discard(future)
+        self.fn = None
+        self.args = ()
+        self.kwargs = {}
+        try:
+            result = future.result()
+        except CancelledError:
+            logger.info("Worker cancelled: task %d", self.task_id)
+        except Exception:
+            error = _current_error()
+            logger.error("Error in worker process: %s: %s", error.exc_type.__name__, error.exc_value)
+            self.signals.error.emit(self.task_id, error)
+        else:
+            self.signals.result.emit(self.task_id, result)
+
+
+def nogil_task(fn: callable) -> callable:
+    """
+    Mark a function as spending its time in C code that releases the GIL, such as
+    NumPy kernels. submit_task runs it on a thread, where it scales across cores.
+
+    :param fn: the function to mark.
+    :return: the same function.
+    """
+    fn._worker_kind = "nogil"
+    return fn
+
+
+def python_task(fn: callable) -> callable:
+    """
+    Mark a function as spending its time in Python bytecode. submit_task runs it in
+    a worker process, because threads would serialize on the GIL. The function
+    must meet ProcessWorker's pickling requirements.
+
+    :param fn: the function to mark.
+    :return: the same function.
+    """
+    fn._worker_kind = "python"
+    return fn
+
+
+def submit_task(signals: WorkerSignals, fn: callable, *args, **kwargs):
+    """
+    Start a function on the executor suited to its workload.
+
+    Functions marked with @python_task go to the shared process pool. All others,
+    including unmarked ones, go to the global thread pool.
+
+    :param signals: shared WorkerSignals instance to emit on.
+    :param fn: function to run.
+    :param args: Arguments to pass to the function.
+    :param kwargs: Keyword arguments to pass to the function.
+    :return: the Worker or ProcessWorker running the function; its task_id tags its signals.
+    """
+    if getattr(fn, '_worker_kind', "nogil") == "python":
+        worker = ProcessWorker(signals, fn, *args, **kwargs)
+        worker.submit()
+    else:
+        worker = Worker(signals, fn, *args, **kwargs)
+        QThreadPool.globalInstance().start(worker)
+    return worker
+
+
+def make_worker_pool(kind: Literal["cpu", "io", "mixed"] = "mixed") -> QThreadPool:
+    """
+    Create a thread pool sized for the kind of work its Workers do.
+
+    - cpu: one thread per core, for work that keeps the CPU busy.
+    - io: min(32, 4 x cores) threads, for work that mostly waits on disk reads of
+      LAS/LAZ files or on child processes such as LAStools.
+    - mixed: twice the number of cores.
+
+    Idle threads are kept alive instead of expiring, so a steady stream of tasks does
+    not keep creating and destroying OS threads.
+
+    :param kind: the kind of work the pool runs.
+    :return: the configured thread pool.
+    """
+    cpu_count = os.cpu_count() or 1
+    thread_counts = {
+        "cpu": cpu_count,
+        "io": min(32, 4 * cpu_count),
+        "mixed": 2 * cpu_count,
+    }
+    if kind not in thread_counts:
+        raise ValueError(f"Unknown worker pool kind: {kind}")
+
+    pool = QThreadPool()
+    pool.setMaxThreadCount(thread_counts[kind])
+    pool.setExpiryTimeout(-1)
+    return pool